@@ -17,6 +17,7 @@ Fault:
 """
 
 import dataclasses
+import os
 from enum import Enum
 
 import numpy as np
@@ -34,6 +35,10 @@ class TectType(Enum):
 
 
 _KM_TO_M = 1000
+# Setting NSHMDB_FAULT_SLOTS=1 before this module is imported gives FaultPlane
+# and Fault __slots__, so instances skip the __dict__ allocation. Slotted
+# instances do not support vars(), weak references or ad-hoc attributes.
+_USE_SLOTS = os.environ.get("NSHMDB_FAULT_SLOTS") == "1"
 
 
 @dataclasses.dataclass
@@ -66,6 +71,9 @@ class FaultPlane:
          3            2
     """
 
+    if _USE_SLOTS:
+        __slots__ = ("corners_nztm", "rake")
+
     corners_nztm: np.ndarray
     rake: float
 
@@ -350,6 +358,9 @@ class Fault:
         Convert fault coordinates to global coordinates.
     """
 
+    if _USE_SLOTS:
+        __slots__ = ("name", "tect_type", "planes")
+
     name: str
     tect_type: Optional[TectType]
     planes: list[FaultPlane]
@@ -393,7 +404,7 @@ class Fault:
             The corners in (lat, lon, depth) format of each fault plane in the
             fault, stacked vertically.
         """
-        return np.vstack([plane.corners for plane in self.planes])
+        return coordinates.nztm_to_wgs_depth(self.corners_nztm())
 
     def corners_nztm(self) -> np.ndarray:
         """Get all corners of a fault.
@@ -21,11 +21,22 @@ in the database.
 >>> db.get_rupture_faults(0) # Should return two faults in this rupture.
 """
 
+import contextlib
+import csv
 import dataclasses
+import functools
 import importlib.resources
+import itertools
+import os
+import re
 import sqlite3
+import subprocess
+import tempfile
+import threading
+import weakref
 from pathlib import Path
 from sqlite3 import Connection
+from typing import Generator, Iterable, Optional
 
 import numpy as np
 import qcore.coordinates
@@ -33,6 +44,80 @@ import qcore.coordinates
 from nshmdb import fault
 from nshmdb.fault import Fault
 
+_INDEX_NAME_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE
+)
+# Number of compiled statements each connection keeps cached.
+_CACHED_STATEMENTS = 256
+# Number of rows fetched at a time when streaming query results.
+_FETCH_BATCH_SIZE = 1000
+# Maximum number of results held by each query cache.
+_QUERY_CACHE_SIZE = 4096
+# Number of rows bound per executemany call when inserting from a generator.
+_INSERT_BATCH_SIZE = 50000
+# Page size (in bytes) of newly created databases.
+_PAGE_SIZE = 8192
+# Maximum number of bytes of the database file to memory map.
+_MMAP_SIZE = 30_000_000_000
+# Negative cache sizes are in KiB, so this is a 512 MiB page cache.
+_CACHE_SIZE = -524288
+# Plane corners are stored as little-endian float64 blobs, see schema.sql.
+_CORNER_DTYPE = np.dtype("<f8")
+# The insert statements are defined once here and shared by the single-row and
+# bulk insert methods.
+_SQL_INSERT_PARENT = (
+    "INSERT OR REPLACE INTO parent_fault (parent_id, name) VALUES (?, ?)"
+)
+_SQL_INSERT_FAULT = (
+    "INSERT OR REPLACE INTO fault (fault_id, name, parent_id) VALUES (?, ?, ?)"
+)
+_SQL_INSERT_PLANE = "INSERT INTO fault_plane (corners, rake, fault_id) VALUES (?, ?, ?)"
+# Inserting many planes per statement amortises the per-statement overhead of
+# executemany. 100 rows of 3 parameters stays under SQLite's default limit of
+# 999 bound parameters.
+_PLANE_INSERT_ROWS = 100
+_SQL_INSERT_PLANE_BATCH = (
+    "INSERT INTO fault_plane (corners, rake, fault_id) VALUES "
+    + ", ".join(["(?, ?, ?)"] * _PLANE_INSERT_ROWS)
+)
+_SQL_INSERT_RUPTURE = "INSERT OR IGNORE INTO rupture (rupture_id) VALUES (?)"
+_SQL_INSERT_RF = "INSERT INTO rupture_faults (rupture_id, fault_id) VALUES (?, ?)"
+
+# Every live NSHMDB instance, keyed by id, so that their read connections can be
+# reset in the child process after a fork.
+_INSTANCES: "weakref.WeakValueDictionary[int, NSHMDB]" = weakref.WeakValueDictionary()
+
+
+def _reset_instances_after_fork():
+    """Reset the read state of every NSHMDB instance in a forked child."""
+    for instance in list(_INSTANCES.values()):
+        instance._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_instances_after_fork)
+
+
+def _corner_blobs_to_nztm_corners(corner_blobs: bytes) -> np.ndarray:
+    """Convert fault_plane corner blobs into fault plane corners in NZTM format.
+
+    Every plane is projected in a single call to
+    `qcore.coordinates.wgs_depth_to_nztm`, rather than one call per plane.
+
+    Parameters
+    ----------
+    corner_blobs : bytes
+        The corners column of one or more fault_plane rows, concatenated.
+
+    Returns
+    -------
+    np.ndarray of shape (n x 4 x 3)
+        The corners of each plane in NZTM format, ordered as in
+        `FaultPlane.corners_nztm`.
+    """
+    corners = np.frombuffer(corner_blobs, dtype=_CORNER_DTYPE).reshape(-1, 3)
+    return qcore.coordinates.wgs_depth_to_nztm(corners).reshape(-1, 4, 3)
+
 
 @dataclasses.dataclass
 class NSHMDB:
@@ -46,28 +131,252 @@ class NSHMDB:
 
     db_filepath: Path
 
+    def __post_init__(self):
+        """Set up the per-instance read connection and caches of query results."""
+        self._lock = threading.RLock()
+        self._read_conn: Optional[Connection] = None
+        _INSTANCES[id(self)] = self
+        # The caches reach the instance through a weak proxy rather than a
+        # bound method, so they don't form a reference cycle that would keep
+        # the instance (and its read connection) alive until garbage collection.
+        instance = weakref.proxy(self)
+        self._cached_fault = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(
+            functools.partial(NSHMDB._query_fault, instance)
+        )
+        self._cached_rupture_faults = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(
+            functools.partial(NSHMDB._query_rupture_faults, instance)
+        )
+
+    def __getstate__(self) -> dict:
+        """Pickle only the database path.
+
+        The read connection, its lock and the query caches are left out, and
+        rebuilt when the instance is unpickled.
+        """
+        return {"db_filepath": self.db_filepath}
+
+    def __setstate__(self, state: dict):
+        """Restore from a pickle, rebuilding the per-instance state."""
+        self.db_filepath = state["db_filepath"]
+        self.__post_init__()
+
+    def __enter__(self) -> "NSHMDB":
+        """Use the instance as a context manager that closes it on exit.
+
+        >>> with NSHMDB('path/to/nshm.db') as db:
+        ...     db.get_rupture_faults(0)
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the read connection, see `NSHMDB.close`."""
+        self.close()
+
+    def clear_cache(self):
+        """Discard the cached query results and parent fault names.
+
+        This must be called if the database is modified through a connection
+        other than `NSHMDB.bulk_load`, which clears the cache itself.
+        """
+        self._cached_fault.cache_clear()
+        self._cached_rupture_faults.cache_clear()
+        self.__dict__.pop("_parent_names", None)
+
+    @functools.cached_property
+    def _parent_names(self) -> dict[int, str]:
+        """The name of every parent fault, keyed by parent id.
+
+        There are only a few thousand parent faults, so the table is loaded
+        once and kept in memory instead of being joined in every rupture query.
+        """
+        with self._read_connection() as conn:
+            return dict(conn.execute("SELECT parent_id, name FROM parent_fault"))
+
+    def _reset_after_fork(self):
+        """Discard the read connection and lock inherited from a parent process.
+
+        SQLite connections must not be used across fork(), and a lock held by
+        another thread at the time of the fork would never be released in the
+        child. This runs in the child immediately after a fork, so that it
+        opens its own read connection and lock on first use.
+        """
+        self._lock = threading.RLock()
+        if self._read_conn is not None:
+            # The inherited connection belongs to the parent, so the child must
+            # not close it, either directly or through the finalizer.
+            self._read_conn_finalizer.detach()
+            self._read_conn = None
+
+    @contextlib.contextmanager
+    def _read_connection(self) -> Generator[Connection, None, None]:
+        """Hold the connection shared by every read query on this instance.
+
+        Reusing one connection keeps its page cache and statement cache warm
+        between queries. The connection is opened lazily, may be used from any
+        thread, and is locked for the duration of the context.
+
+        Yields
+        ------
+        Connection
+            The read connection, in autocommit mode.
+        """
+        with self._lock:
+            if self._read_conn is None:
+                self._read_conn = self.connection(check_same_thread=False)
+                # Reads never need a transaction, so don't let sqlite3 open one.
+                self._read_conn.isolation_level = None
+                # sqlite3 connections sit in a reference cycle with their own
+                # statement cache, so close the connection as soon as the
+                # instance is freed rather than waiting for garbage collection.
+                self._read_conn_finalizer = weakref.finalize(
+                    self, self._read_conn.close
+                )
+            yield self._read_conn
+
+    def close(self):
+        """Close the connection shared by the read queries, if it is open."""
+        with self._lock:
+            if self._read_conn is not None:
+                self._read_conn_finalizer()
+                self._read_conn = None
+
     def create(self):
         """Create the tables for the NSHMDB database."""
-        schema_traversable = importlib.resources.files("nshmdb.schema") / "schema.sql"
+        with self.connection() as conn:
+            # The page size is fixed once the first table is created.
+            conn.execute(f"PRAGMA page_size={_PAGE_SIZE}")
+            conn.executescript(self._read_schema("schema.sql"))
+            self.rebuild_indexes(conn)
+
+    def _read_schema(self, schema_name: str) -> str:
+        """Read an SQL script from the schema package.
+
+        Parameters
+        ----------
+        schema_name : str
+            The filename of the script, e.g. "schema.sql".
+
+        Returns
+        -------
+        str
+            The contents of the script.
+        """
+        schema_traversable = importlib.resources.files("nshmdb.schema") / schema_name
         with importlib.resources.as_file(schema_traversable) as schema_path:
             with open(schema_path, "r", encoding="utf-8") as schema_file_handle:
-                schema = schema_file_handle.read()
-        with self.connection() as conn:
-            conn.executescript(schema)
+                return schema_file_handle.read()
 
-    def connection(self) -> Connection:
+    def connection(self, check_same_thread: bool = True) -> Connection:
         """Establish a connection to the SQLite database.
 
+        The connection uses the default sqlite3 transaction handling, so
+        `with db.connection() as conn:` commits its inserts together when the
+        block exits. The database file is memory mapped and the page cache
+        enlarged, trading virtual address space and memory for fewer read
+        syscalls per query.
+
+        Parameters
+        ----------
+        check_same_thread : bool
+            If False, the connection may be used from threads other than the
+            one that created it.
+
         Returns
         -------
         Connection
         """
-        return sqlite3.connect(self.db_filepath)
+        conn = sqlite3.connect(
+            self.db_filepath,
+            check_same_thread=check_same_thread,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size={_CACHE_SIZE}")
+        return conn
+
+    @contextlib.contextmanager
+    def bulk_load(self) -> Generator[Connection, None, None]:
+        """Open a connection tuned for bulk loading the database.
+
+        The connection switches the database to write-ahead logging, relaxes
+        disk synchronisation, keeps temporary tables in memory and runs every
+        insert inside a single transaction, so that the cost of syncing to
+        disk is paid once rather than once per row. The transaction is
+        committed when the context exits normally and rolled back if an
+        exception is raised. Indexes are dropped for the duration of the load
+        and rebuilt once the transaction has committed, see
+        `NSHMDB.drop_indexes`. Scripts populating the database should use this
+        in place of `NSHMDB.connection`.
+
+        >>> with db.bulk_load() as conn:
+        ...     db.insert_faults(conn, faults)
+
+        Yields
+        ------
+        Connection
+            The db connection object, inside an open transaction.
+        """
+        conn = self.connection()
+        # Switch to autocommit mode so that the explicit BEGIN and COMMIT below
+        # control the transaction.
+        conn.isolation_level = None
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("BEGIN")
+            try:
+                self.drop_indexes(conn)
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self.rebuild_indexes(conn)
+            self.clear_cache()
+        finally:
+            conn.close()
+
+    def drop_indexes(self, conn: Connection):
+        """Drop the indexes defined in the schema's indexes.sql.
+
+        Maintaining an index while inserting millions of rows is much more
+        expensive than building it once the rows are in place, so the indexes
+        should be dropped before a bulk load and restored afterwards with
+        `NSHMDB.rebuild_indexes`.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        """
+        for index_name in _INDEX_NAME_RE.findall(self._read_schema("indexes.sql")):
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    def rebuild_indexes(self, conn: Connection):
+        """Recreate the indexes defined in the schema's indexes.sql.
+
+        The query planner statistics are refreshed with ANALYZE afterwards, so
+        that the planner chooses the rebuilt indexes for the read queries.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object. Any open transaction on this connection
+            is committed before the indexes are built.
+        """
+        conn.executescript(self._read_schema("indexes.sql"))
+        conn.execute("ANALYZE")
 
     # The functions `insert_parent`, `insert_fault`, and `add_fault_to_rupture`
     # reuse a connection for efficiency (rather than use db.connection()). There
     # are thousands of faults and tens of millions of rupture, fault binding
     # pairs. Without reusing a connection it takes hours to setup the database.
+    # The connection should come from `db.bulk_load()` so that every insert
+    # shares one transaction. The bulk variants `insert_parents`,
+    # `insert_faults`, `bulk_create_ruptures`, `add_faults_to_rupture` and
+    # `add_faults_to_ruptures` go further and bind all their rows with
+    # `executemany`, and should be preferred when loading the database.
 
     def insert_parent(self, conn: Connection, parent_id: int, parent_name: str):
         """Insert parent fault data into the database.
@@ -81,10 +390,19 @@ class NSHMDB:
         name : str
             Name of the parent fault.
         """
-        conn.execute(
-            """INSERT OR REPLACE INTO parent_fault (parent_id, name) VALUES (?, ?)""",
-            (parent_id, parent_name),
-        )
+        self.insert_parents(conn, [(parent_id, parent_name)])
+
+    def insert_parents(self, conn: Connection, parents: Iterable[tuple[int, str]]):
+        """Insert many parent faults into the database.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        parents : Iterable[tuple[int, str]]
+            The (parent_id, parent_name) pairs to insert.
+        """
+        conn.executemany(_SQL_INSERT_PARENT, parents)
 
     def insert_fault(
         self, conn: Connection, fault_id: int, parent_id: int, fault: Fault
@@ -102,36 +420,68 @@ class NSHMDB:
         fault : Fault
             Fault object containing fault geometry.
         """
-        conn.execute(
-            """INSERT OR REPLACE INTO fault (fault_id, name, parent_id) VALUES (?, ?, ?)""",
-            (fault_id, fault.name, parent_id),
+        self.insert_faults(conn, [(fault_id, parent_id, fault)])
+
+    def insert_faults(self, conn: Connection, items: list[tuple[int, int, Fault]]):
+        """Insert many faults, and their planes, into the database.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        items : list[tuple[int, int, Fault]]
+            The (fault_id, parent_id, fault) triples to insert.
+        """
+        conn.executemany(
+            _SQL_INSERT_FAULT,
+            [(fault_id, fault.name, parent_id) for fault_id, parent_id, fault in items],
+        )
+        fault_planes = [
+            (fault_id, plane) for fault_id, _, fault in items for plane in fault.planes
+        ]
+        if not fault_planes:
+            return
+        # Project every plane's corners in one call, rather than through each
+        # plane's `corners` property.
+        corners = np.ascontiguousarray(
+            qcore.coordinates.nztm_to_wgs_depth(
+                np.vstack([plane.corners_nztm for _, plane in fault_planes])
+            ).reshape(-1, 4, 3),
+            dtype=_CORNER_DTYPE,
+        )
+        plane_rows = [
+            (plane_corners.tobytes(), plane.rake, fault_id)
+            for plane_corners, (fault_id, plane) in zip(corners, fault_planes)
+        ]
+        batched_rows = len(plane_rows) - len(plane_rows) % _PLANE_INSERT_ROWS
+        conn.executemany(
+            _SQL_INSERT_PLANE_BATCH,
+            (
+                list(
+                    itertools.chain.from_iterable(
+                        plane_rows[i : i + _PLANE_INSERT_ROWS]
+                    )
+                )
+                for i in range(0, batched_rows, _PLANE_INSERT_ROWS)
+            ),
+        )
+        conn.executemany(_SQL_INSERT_PLANE, plane_rows[batched_rows:])
+
+    def bulk_create_ruptures(self, conn: Connection, rupture_ids: Iterable[int]):
+        """Insert many ruptures into the database.
+
+        Ruptures that already exist are left untouched.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        rupture_ids : Iterable[int]
+            The IDs of the ruptures to insert.
+        """
+        conn.executemany(
+            _SQL_INSERT_RUPTURE, ((rupture_id,) for rupture_id in rupture_ids)
         )
-        for plane in fault.planes:
-            conn.execute(
-                """INSERT INTO fault_plane (
-                    top_left_lat,
-                    top_left_lon,
-                    top_right_lat,
-                    top_right_lon,
-                    bottom_right_lat,
-                    bottom_right_lon,
-                    bottom_left_lat,
-                    bottom_left_lon,
-                    top_depth,
-                    bottom_depth,
-                    rake,
-                    fault_id
-                ) VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )""",
-                (
-                    *plane.corners[:, :2].ravel(),
-                    plane.corners[0, 2],
-                    plane.corners[-1, 2],
-                    plane.rake,
-                    fault_id,
-                ),
-            )
 
     def add_fault_to_rupture(self, conn: Connection, rupture_id: int, fault_id: int):
         """Insert rupture data into the database.
@@ -142,20 +492,107 @@ class NSHMDB:
             The db connection object.
         rupture_id : int
             ID of the rupture.
-        fault_ids : list[int]
-            List of faults involved in the rupture.
+        fault_id : int
+            ID of the fault involved in the rupture.
         """
-        conn.execute(
-            "INSERT OR REPLACE INTO rupture (rupture_id) VALUES (?)", (rupture_id,)
-        )
-        conn.execute(
-            "INSERT INTO rupture_faults (rupture_id, fault_id) VALUES (?, ?)",
-            (rupture_id, fault_id),
+        self.add_faults_to_rupture(conn, rupture_id, [fault_id])
+
+    def add_faults_to_rupture(
+        self, conn: Connection, rupture_id: int, fault_ids: Iterable[int]
+    ):
+        """Insert a rupture and all the faults involved in it into the database.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        rupture_id : int
+            ID of the rupture.
+        fault_ids : Iterable[int]
+            The faults involved in the rupture.
+        """
+        conn.execute(_SQL_INSERT_RUPTURE, (rupture_id,))
+        conn.executemany(
+            _SQL_INSERT_RF,
+            ((rupture_id, fault_id) for fault_id in fault_ids),
         )
 
+    def add_faults_to_ruptures(
+        self, conn: Connection, pairs: Iterable[tuple[int, int]]
+    ):
+        """Bind many faults to ruptures in the database.
+
+        Unlike `add_faults_to_rupture`, this does not create the ruptures
+        themselves, which should be inserted beforehand with
+        `bulk_create_ruptures`.
+
+        Parameters
+        ----------
+        conn : Connection
+            The db connection object.
+        pairs : Iterable[tuple[int, int]]
+            The (rupture_id, fault_id) pairs to insert. This may be a
+            generator, which is consumed in batches.
+        """
+        pairs = iter(pairs)
+        while batch := list(itertools.islice(pairs, _INSERT_BATCH_SIZE)):
+            conn.executemany(_SQL_INSERT_RF, batch)
+
+    def bulk_import_rupture_faults(self, pairs: Iterable[tuple[int, int]]):
+        """Bind many faults to ruptures using the sqlite3 shell's CSV import.
+
+        The pairs are written to a temporary CSV file which the `sqlite3`
+        command line tool imports directly, so rows are never bound one at a
+        time from Python. This is the fastest way to perform the initial load
+        of the rupture_faults table. Ruptures referenced by the pairs are
+        created if they do not already exist.
+
+        The import runs in a separate process, so it must not be called while
+        a write transaction (such as `NSHMDB.bulk_load`) is open on the
+        database.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[int, int]]
+            The (rupture_id, fault_id) pairs to insert.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the `sqlite3` command line tool is not installed.
+        subprocess.CalledProcessError
+            If the import fails.
+        """
+        with tempfile.TemporaryDirectory() as import_directory:
+            csv_path = Path(import_directory) / "rupture_faults.csv"
+            with open(csv_path, "w", newline="", encoding="utf-8") as csv_handle:
+                csv.writer(csv_handle).writerows(pairs)
+            import_script = f"""
+.bail on
+.mode csv
+CREATE TEMP TABLE rupture_faults_import (rupture_id INTEGER, fault_id INTEGER);
+.import "{csv_path}" rupture_faults_import
+BEGIN;
+INSERT OR IGNORE INTO rupture (rupture_id)
+    SELECT DISTINCT rupture_id FROM rupture_faults_import;
+INSERT INTO rupture_faults (rupture_id, fault_id)
+    SELECT rupture_id, fault_id FROM rupture_faults_import;
+COMMIT;
+"""
+            subprocess.run(
+                ["sqlite3", str(self.db_filepath)],
+                input=import_script,
+                text=True,
+                check=True,
+            )
+        self.clear_cache()
+
     def get_fault(self, fault_id: int) -> Fault:
         """Get a specific fault definition from a database.
 
+        Results are cached, so the returned fault is shared between calls and
+        must not be modified.
+
         Parameters
         ----------
         fault_id : int
@@ -166,44 +603,47 @@ class NSHMDB:
         Fault
             The fault geometry.
         """
+        return self._cached_fault(fault_id)
 
-        with self.connection() as conn:
+    def _query_fault(self, fault_id: int) -> Fault:
+        """Query a fault definition from the database, bypassing the cache.
+
+        Parameters
+        ----------
+        fault_id : int
+            The id of the fault to retreive.
+
+        Returns
+        -------
+        Fault
+            The fault geometry.
+        """
+        with self._read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * from fault_plane where fault_id = ?", (fault_id,))
-            planes = []
-            for (
-                _,
-                top_left_lat,
-                top_left_lon,
-                top_right_lat,
-                top_right_lon,
-                bottom_right_lat,
-                bottom_right_lon,
-                bottom_left_lat,
-                bottom_left_lon,
-                top,
-                bottom,
-                rake,
-                _,
-            ) in cursor.fetchall():
-                corners = np.array(
-                    [
-                        [top_left_lat, top_left_lon, top],
-                        [top_right_lat, top_right_lon, top],
-                        [bottom_right_lat, bottom_right_lon, bottom],
-                        [bottom_left_lat, bottom_left_lon, bottom],
-                    ]
-                )
-                planes.append(
-                    fault.FaultPlane(qcore.coordinates.wgs_depth_to_nztm(corners), rake)
-                )
-            cursor.execute("SELECT * from fault where fault_id = ?", (fault_id,))
-            fault_id, name, _, _ = cursor.fetchone()
-            return Fault(name, None, planes)
+            cursor.execute(
+                "SELECT corners, rake FROM fault_plane WHERE fault_id = ?",
+                (fault_id,),
+            )
+            fault_planes = cursor.fetchall()
+            cursor.execute("SELECT name FROM fault WHERE fault_id = ?", (fault_id,))
+            (name,) = cursor.fetchone()
+        # Decode and project outside the lock so that other threads can query
+        # the database in the meantime.
+        corners = _corner_blobs_to_nztm_corners(
+            b"".join(plane_corners for plane_corners, _ in fault_planes)
+        )
+        planes = [
+            fault.FaultPlane(plane_corners, rake)
+            for plane_corners, (_, rake) in zip(corners, fault_planes)
+        ]
+        return Fault(name, None, planes)
 
     def get_rupture_faults(self, rupture_id: int) -> list[Fault]:
         """Retrieve faults involved in a rupture from the database.
 
+        Results are cached, so the returned faults are shared between calls
+        and must not be modified.
+
         Parameters
         ----------
         rupture_id : int
@@ -212,56 +652,90 @@ class NSHMDB:
         -------
         list[Fault]
         """
-        with self.connection() as conn:
+        return list(self._cached_rupture_faults(rupture_id))
+
+    def _query_rupture_faults(self, rupture_id: int) -> list[Fault]:
+        """Query the faults involved in a rupture, bypassing the cache.
+
+        Parameters
+        ----------
+        rupture_id : int
+
+        Returns
+        -------
+        list[Fault]
+        """
+        corners, rakes, parent_ids = self.get_rupture_fault_arrays(rupture_id)
+        planes = [
+            fault.FaultPlane(plane_corners, rake)
+            for plane_corners, rake in zip(corners, rakes.tolist())
+        ]
+        # Planes are ordered by parent id, so each parent's planes form a
+        # contiguous slice starting at the first occurrence of its id.
+        group_parent_ids, group_starts = np.unique(parent_ids, return_index=True)
+        group_starts = group_starts.tolist()
+        group_ends = group_starts[1:] + [len(planes)]
+        return [
+            Fault(
+                name=self._parent_names[parent_id],
+                tect_type=None,
+                planes=planes[start:end],
+            )
+            for parent_id, start, end in zip(
+                group_parent_ids.tolist(), group_starts, group_ends
+            )
+        ]
+
+    def get_rupture_fault_arrays(
+        self, rupture_id: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retrieve the planes of the faults involved in a rupture as arrays.
+
+        This skips building `Fault` and `FaultPlane` objects, for callers that
+        only need the plane geometry in bulk. Unlike `get_rupture_faults`, the
+        result is not cached.
+
+        Parameters
+        ----------
+        rupture_id : int
+
+        Returns
+        -------
+        corners : np.ndarray of shape (n x 4 x 3)
+            The corners of every plane in the rupture in NZTM format, ordered
+            as in `FaultPlane.corners_nztm`.
+        rake : np.ndarray of shape (n,)
+            The rake of every plane.
+        parent_ids : np.ndarray of shape (n,)
+            The parent fault id of every plane. Planes are sorted by parent
+            id, so the planes of each parent fault are contiguous.
+        """
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """SELECT fs.*, p.parent_id, p.name
+                """SELECT
+                    fs.corners,
+                    fs.rake,
+                    f.parent_id
                 FROM fault_plane fs
                 JOIN rupture_faults rf ON fs.fault_id = rf.fault_id
                 JOIN fault f ON fs.fault_id = f.fault_id
-                JOIN parent_fault p ON f.parent_id = p.parent_id
                 WHERE rf.rupture_id = ?
                 ORDER BY f.parent_id""",
                 (rupture_id,),
             )
-            fault_planes = cursor.fetchall()
-            cur_parent_id = None
-            faults = []
-            for (
-                _,
-                top_left_lat,
-                top_left_lon,
-                top_right_lat,
-                top_right_lon,
-                bottom_right_lat,
-                bottom_right_lon,
-                bottom_left_lat,
-                bottom_left_lon,
-                top,
-                bottom,
-                rake,
-                _,
-                parent_id,
-                parent_name,
-            ) in fault_planes:
-                if parent_id != cur_parent_id:
-                    faults.append(
-                        Fault(
-                            name=parent_name,
-                            tect_type=None,
-                            planes=[],
-                        )
-                    )
-                    cur_parent_id = parent_id
-                corners = np.array(
-                    [
-                        [top_left_lat, top_left_lon, top],
-                        [top_right_lat, top_right_lon, top],
-                        [bottom_right_lat, bottom_right_lon, bottom],
-                        [bottom_left_lat, bottom_left_lon, bottom],
-                    ]
-                )
-                faults[-1].planes.append(
-                    fault.FaultPlane(qcore.coordinates.wgs_depth_to_nztm(corners), rake)
-                )
-            return faults
+            # Stream the planes in batches so that only one batch of row
+            # tuples is alive at a time, rather than the whole rupture.
+            cursor.arraysize = _FETCH_BATCH_SIZE
+            corner_blobs = []
+            rakes = []
+            parent_ids = []
+            for fault_planes in iter(lambda: cursor.fetchmany(cursor.arraysize), []):
+                corner_blobs.append(b"".join(plane[0] for plane in fault_planes))
+                rakes.extend(plane[1] for plane in fault_planes)
+                parent_ids.extend(plane[2] for plane in fault_planes)
+        return (
+            _corner_blobs_to_nztm_corners(b"".join(corner_blobs)),
+            np.array(rakes, dtype=np.float64),
+            np.array(parent_ids, dtype=np.int64),
+        )
@@ -0,0 +1,7 @@
+-- Indexes are kept separate from the table definitions so that they can be
+-- dropped while bulk loading the database and rebuilt afterwards.
+--
+-- Lookups of rupture_faults by rupture_id are already covered by the index
+-- SQLite maintains for its UNIQUE(rupture_id, fault_id) constraint.
+
+CREATE INDEX IF NOT EXISTS idx_fault_plane_fault_id ON fault_plane(fault_id);
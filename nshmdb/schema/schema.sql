@@ -11,18 +11,12 @@ CREATE TABLE IF NOT EXISTS parent_fault (
     name TEXT NOT NULL
 );
 
+-- The corners of each plane are stored as a blob of 12 little-endian float64
+-- values: the (lat, lon, depth) coordinates of the top left, top right, bottom
+-- right and bottom left corners, in that order.
 CREATE TABLE IF NOT EXISTS fault_plane (
     plane_id INTEGER PRIMARY KEY,
-    top_left_lat REAL NOT NULL,
-    top_left_lon REAL NOT NULL,
-    top_right_lat REAL NOT NULL,
-    top_right_lon REAL NOT NULL,
-    bottom_right_lat REAL NOT NULL,
-    bottom_right_lon REAL NOT NULL,
-    bottom_left_lat REAL NOT NULL,
-    bottom_left_lon REAL NOT NULL,
-    top_depth REAL NOT NULL,
-    bottom_depth REAL NOT NULL,
+    corners BLOB NOT NULL,
     rake REAL NOT NULL,
     fault_id INTEGER NOT NULL,
     FOREIGN KEY(fault_id) REFERENCES fault(fault_id)
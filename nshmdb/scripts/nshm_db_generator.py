@@ -22,6 +22,7 @@ Options:
 Example:
     python generate_nshm2022_data.py data/cru_solutions.zip output/nshm2022.sqlite
 """
+
 import zipfile
 from pathlib import Path
 from typing import Annotated
@@ -124,7 +125,7 @@ def main(
 
     with zipfile.ZipFile(
         cru_solutions_zip_path, "r"
-    ) as cru_solutions_zip_file, db.connection() as conn:
+    ) as cru_solutions_zip_file, db.bulk_load() as conn:
 
         with cru_solutions_zip_file.open(
             str(FAULT_INFORMATION_PATH)
@@ -134,13 +135,26 @@ def main(
         faults = extract_faults_from_info(faults_info)
 
         if not skip_faults_creation:
-            for i, fault in enumerate(faults):
-                fault_info = faults_info[i]
-                parent_id = fault_info.properties["ParentID"]
-                db.insert_parent(conn, parent_id, fault_info.properties["ParentName"])
-                db.insert_fault(
-                    conn, fault_info.properties["FaultID"], parent_id, fault
-                )
+            db.insert_parents(
+                conn,
+                {
+                    fault_info.properties["ParentID"]: fault_info.properties[
+                        "ParentName"
+                    ]
+                    for fault_info in faults_info.features
+                }.items(),
+            )
+            db.insert_faults(
+                conn,
+                [
+                    (
+                        faults_info[i].properties["FaultID"],
+                        faults_info[i].properties["ParentID"],
+                        fault,
+                    )
+                    for i, fault in enumerate(faults)
+                ],
+            )
         if not skip_rupture_creation:
             with cru_solutions_zip_file.open(
                 str(RUPTURE_FAULT_JOIN_PATH)
@@ -149,12 +163,20 @@ def main(
                 rupture_fault_join_df["section"] = rupture_fault_join_df[
                     "section"
                 ].astype("Int64")
-                for _, row in tqdm.tqdm(
-                    rupture_fault_join_df.iterrows(),
-                    desc="Binding ruptures to faults",
-                    total=len(rupture_fault_join_df),
-                ):
-                    db.add_fault_to_rupture(conn, row["rupture"], row["section"])
+                db.bulk_create_ruptures(
+                    conn, rupture_fault_join_df["rupture"].unique().tolist()
+                )
+                db.add_faults_to_ruptures(
+                    conn,
+                    tqdm.tqdm(
+                        zip(
+                            rupture_fault_join_df["rupture"].tolist(),
+                            rupture_fault_join_df["section"].tolist(),
+                        ),
+                        desc="Binding ruptures to faults",
+                        total=len(rupture_fault_join_df),
+                    ),
+                )
 
 
 if __name__ == "__main__":